@@ -1,45 +1,492 @@
 """The magical forge where directory trees come to life."""
 
+import asyncio
+from collections.abc import Callable
+from collections.abc import Iterable
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from dataclasses import asdict
+from dataclasses import dataclass
+from dataclasses import field
+from functools import partial
+from itertools import chain
+import os
 from pathlib import Path
-from typing import TypedDict
+from pathlib import PurePath
+from typing import Any
+from typing import cast
 
 from rich.console import Console
 from rich.table import Table
+from rich.text import Text
 
 from treemancer.models import DirectoryNode
-from treemancer.models import FileNode
 from treemancer.models import FileSystemNode
 from treemancer.models import FileSystemTree
 from treemancer.ui.components import UIComponents
+from treemancer.ui.styles import get_extension
+
+
+# Flags for creating files opened for writing raw bytes; an existing file
+# keeps its content, as with Path.touch
+_CREATE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+# Flags for files whose content is written, replacing any existing content
+_WRITE_FLAGS = _CREATE_FLAGS | os.O_TRUNC
+
+
+# Errors recorded per path instead of aborting creation; ValueError covers
+# embedded null bytes in names and content that cannot be encoded
+_FS_ERRORS = (OSError, ValueError)
+
+
+# Opening files relative to a directory descriptor needs openat() support
+_DIR_FD_SUPPORTED = os.open in os.supports_dir_fd and hasattr(os, "O_DIRECTORY")
+
+
+def _write_file(path: str, content: str | None, dir_fd: int | None = None) -> None:
+    """Write text to a file as raw bytes, bypassing Python's buffered I/O stack.
+
+    Only files with content are truncated, an existing file written without
+    content is left untouched. Names spanning several segments
+    (``docs/api.md``) get their missing intermediate directories created,
+    unless opened relative to dir_fd.
+
+    Parameters
+    ----------
+    path : str
+        File to create, or to truncate when content is not empty, relative
+        to dir_fd when given
+    content : str | None
+        Content to write, None or empty for an empty file
+    dir_fd : int | None
+        Descriptor of the directory path is relative to
+    """
+    # Always UTF-8, independent of the locale's preferred encoding
+    data = content.encode("utf-8") if content else b""
+    flags = _WRITE_FLAGS if data else _CREATE_FLAGS
+    try:
+        fd = os.open(path, flags, 0o666, dir_fd=dir_fd)
+    except FileNotFoundError:
+        if dir_fd is not None:
+            raise
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _make_dir(path: str) -> None:
+    """Create a directory, accepting an existing directory.
+
+    Parent nodes are created first, so a plain mkdir usually suffices. Names
+    spanning several segments (``src/utils``) fall back to creating their
+    missing intermediate directories.
+
+    Parameters
+    ----------
+    path : str
+        Directory to create
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+    except FileNotFoundError:
+        os.makedirs(path, exist_ok=True)
+
+
+def _try_make_dir(path: str) -> Exception | None:
+    """Create a directory, returning the error instead of raising it.
+
+    Parameters
+    ----------
+    path : str
+        Directory to create
+
+    Returns
+    -------
+    Exception | None
+        Error raised while creating the directory, if any
+    """
+    try:
+        _make_dir(path)
+    except _FS_ERRORS as e:
+        return e
+    return None
+
+
+def _write_files(
+    group: tuple[str, list[tuple[str, str | None]]],
+) -> list[tuple[str, Exception]]:
+    """Write the files of a single directory.
+
+    Files are opened relative to a descriptor of their directory when the
+    platform supports it, so the kernel resolves the directory path once
+    instead of once per file.
+
+    Parameters
+    ----------
+    group : tuple[str, list[tuple[str, str | None]]]
+        Directory path with the names and content of its files
+
+    Returns
+    -------
+    list[tuple[str, Exception]]
+        Paths of the files that could not be written, with their errors
+    """
+    dir_path, dir_files = group
+    errors: list[tuple[str, Exception]] = []
+
+    dir_fd: int | None = None
+    if _DIR_FD_SUPPORTED:
+        try:
+            dir_fd = os.open(dir_path, os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            dir_fd = None  # Fall back to full paths
+
+    prefix = dir_path + os.sep
+    try:
+        for name, content in dir_files:
+            try:
+                if dir_fd is None:
+                    _write_file(prefix + name, content)
+                else:
+                    try:
+                        _write_file(name, content, dir_fd)
+                    except FileNotFoundError:
+                        # Retried by full path, creating intermediate directories
+                        _write_file(prefix + name, content)
+            except _FS_ERRORS as e:
+                errors.append((prefix + name, e))
+    finally:
+        if dir_fd is not None:
+            os.close(dir_fd)
+
+    return errors
+
+
+# Fewer jobs than this run inline, where a thread hand-off costs more than
+# it overlaps
+_PARALLEL_MIN_JOBS = 4
+
+
+def _map_jobs[T, R](
+    executor: ThreadPoolExecutor | None, fn: Callable[[T], R], items: list[T]
+) -> Iterable[R]:
+    """Apply a function to items, on the executor when worth it.
+
+    Parameters
+    ----------
+    executor : ThreadPoolExecutor | None
+        Thread pool to use, or None to run inline
+    fn : Callable[[T], R]
+        Function to apply
+    items : list[T]
+        Items to apply the function to
+
+    Returns
+    -------
+    Iterable[R]
+        Results in the order of items
+    """
+    if executor is None or len(items) < _PARALLEL_MIN_JOBS:
+        return map(fn, items)
+    return executor.map(fn, items)
+
+
+@dataclass(slots=True)
+class _CreationPlan:
+    """Directories and files of a tree, flattened for creation."""
+
+    # Directory paths with their parent node's path, per depth level, parents
+    # first; the parent is explicit since names may span several segments
+    levels: list[list[tuple[str, str]]] = field(
+        default_factory=list[list[tuple[str, str]]]
+    )
+    # File names with their content, grouped by parent directory path
+    files_by_dir: list[tuple[str, list[tuple[str, str | None]]]] = field(
+        default_factory=list[tuple[str, list[tuple[str, str | None]]]]
+    )
+    # Every collected path in depth-first order, each directory followed by
+    # its children as the tree lists them
+    order: list[str] = field(default_factory=list[str])
+
+
+def _clean_name(name: str) -> str:
+    """Normalize a node name as pathlib would when joining it.
+
+    Only names holding a separator (``src/``, ``docs//api.md``) need it, so
+    plain names are returned without building a path.
+
+    Parameters
+    ----------
+    name : str
+        Node name
+
+    Returns
+    -------
+    str
+        Name without trailing, repeated or ``.`` segments
+    """
+    if "/" in name or os.sep in name:
+        return os.fspath(PurePath(name))
+    return name
+
+
+def _collect_paths(root: DirectoryNode, base: str, create_files: bool) -> _CreationPlan:
+    """Flatten a tree into directories grouped by depth and files to write.
+
+    Paths are plain strings: only the root is joined with os.path.join,
+    descendants append os.sep and their name to the parent path, avoiding
+    a Path allocation and a join call per node.
+
+    Parameters
+    ----------
+    root : DirectoryNode
+        Root directory of the tree to flatten
+    base : str
+        Base directory the tree is created in
+    create_files : bool
+        Whether file nodes should be collected
+
+    Returns
+    -------
+    _CreationPlan
+        Collected directories and files
+    """
+    plan = _CreationPlan()
+    levels = plan.levels
+    add_file_group = plan.files_by_dir.append
+    add_to_order = plan.order.append
+
+    stack: list[tuple[FileSystemNode, str, str, int]] = [
+        (root, os.path.join(base, _clean_name(root.name)), base, 0)
+    ]
+    pop = stack.pop
+    push = stack.extend
+
+    while stack:
+        node, node_path, parent_path, depth = pop()
+        add_to_order(node_path)
+
+        if node.is_directory:
+            node = cast(DirectoryNode, node)
+            # Depth-first order reaches a new level right after its parent level
+            if depth == len(levels):
+                levels.append([])
+            levels[depth].append((node_path, parent_path))
+
+            if create_files and node.files:
+                # Content is encoded when written, so dry runs never encode it
+                dir_files = [
+                    (_clean_name(file.name), file.content) for file in node.files
+                ]
+                add_file_group((node_path, dir_files))
+
+            # Reversed so children are popped in their original order; files
+            # were grouped above and are only pushed to keep their place in
+            # the order
+            prefix = node_path + os.sep
+            push(
+                (child, prefix + _clean_name(child.name), node_path, depth + 1)
+                for child in reversed(node.children)
+                if create_files or child.is_directory
+            )
 
-
-class CreationResult(TypedDict):
-    """Typed dictionary for creation results."""
-
-    directories_created: int
-    files_created: int
-    errors: list[str]
-    structure: list[str]
-
-
+    return plan
+
+
+def _pending_directories(
+    level: list[tuple[str, str]], failed: dict[str, str | None]
+) -> list[str]:
+    """Get the directories of a level to create, skipping failed subtrees.
+
+    Directories whose parent failed are recorded as skipped, with no
+    message, so their own descendants are skipped in turn.
+
+    Parameters
+    ----------
+    level : list[tuple[str, str]]
+        Directory and parent paths of a depth level
+    failed : dict[str, str | None]
+        Paths that were not created, updated in place
+
+    Returns
+    -------
+    list[str]
+        Directories whose parent exists
+    """
+    pending: list[str] = []
+    for path, parent in level:
+        if failed and parent in failed:
+            failed[path] = None
+        else:
+            pending.append(path)
+    return pending
+
+
+def _pending_file_groups(
+    plan: _CreationPlan, failed: dict[str, str | None]
+) -> list[tuple[str, list[tuple[str, str | None]]]]:
+    """Get the file groups to write, skipping those of failed directories.
+
+    Parameters
+    ----------
+    plan : _CreationPlan
+        Plan whose files are written
+    failed : dict[str, str | None]
+        Paths that were not created, updated in place
+
+    Returns
+    -------
+    list[tuple[str, list[tuple[str, str | None]]]]
+        File groups whose directory exists
+    """
+    pending: list[tuple[str, list[tuple[str, str | None]]]] = []
+    for dir_path, dir_files in plan.files_by_dir:
+        if failed and dir_path in failed:
+            prefix = dir_path + os.sep
+            failed.update((prefix + name, None) for name, _ in dir_files)
+        else:
+            pending.append((dir_path, dir_files))
+    return pending
+
+
+def _iter_file_paths(plan: _CreationPlan) -> Iterator[tuple[str, str | None]]:
+    """Iterate full paths and content of the files of a plan.
+
+    Parameters
+    ----------
+    plan : _CreationPlan
+        Plan to iterate
+
+    Yields
+    ------
+    tuple[str, str | None]
+        File path and its content
+    """
+    for dir_path, dir_files in plan.files_by_dir:
+        prefix = dir_path + os.sep
+        for name, content in dir_files:
+            yield prefix + name, content
+
+
+def _group_by_extension(
+    plan: _CreationPlan, failed: dict[str, str | None]
+) -> dict[str, list[str]]:
+    """Group the names of the files of a plan that were created by extension.
+
+    Parameters
+    ----------
+    plan : _CreationPlan
+        Plan whose files are grouped
+    failed : dict[str, str | None]
+        Paths that were not created
+
+    Returns
+    -------
+    dict[str, list[str]]
+        File names keyed by lowercase extension ("no extension" when missing)
+    """
+    file_counts: dict[str, list[str]] = {}
+    for path, _ in _iter_file_paths(plan):
+        if path not in failed:
+            name = os.path.basename(path)
+            extension = get_extension(name) or "no extension"
+            file_counts.setdefault(extension, []).append(name)
+    return file_counts
+
+
+def _merge_plans(
+    base: str, roots: list[str], plans: list[_CreationPlan]
+) -> _CreationPlan:
+    """Combine the plans of several trees into a single plan.
+
+    Parameters
+    ----------
+    base : str
+        Base directory the roots are created in
+    roots : list[str]
+        Directory each plan's tree is created in, created as the first level
+    plans : list[_CreationPlan]
+        Plans collected under the matching root
+
+    Returns
+    -------
+    _CreationPlan
+        Plan whose levels hold the same depth of every tree
+    """
+    merged = _CreationPlan(levels=[[(root, base) for root in roots]])
+    for plan in plans:
+        for depth, level in enumerate(plan.levels, 1):
+            if depth == len(merged.levels):
+                merged.levels.append([])
+            merged.levels[depth].extend(level)
+        merged.files_by_dir.extend(plan.files_by_dir)
+    return merged
+
+
+def _base_prefix(base_path: Path) -> str:
+    """Get the string prefix nodes are joined to.
+
+    The current directory maps to an empty prefix so created paths stay
+    relative (``project/src`` rather than ``./project/src``), as pathlib
+    renders them.
+    """
+    base = os.fspath(base_path)
+    return "" if base == "." else base
+
+
+@dataclass(slots=True)
+class CreationResult:
+    """Summary of a tree creation run."""
+
+    directories_created: int = 0
+    files_created: int = 0
+    errors: list[str] = field(default_factory=list[str])
+    structure: list[str] = field(default_factory=list[str])
+    files_by_extension: dict[str, list[str]] = field(
+        default_factory=dict[str, list[str]]
+    )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert result to dictionary representation."""
+        return asdict(self)
+
+
+@dataclass(slots=True)
 class MultipleCreationResult(CreationResult):
-    """Typed dictionary for multiple creation results."""
+    """Summary of a tree creation run within a multiple trees batch."""
 
-    tree_number: int
+    tree_number: int = 0
 
 
 class TreeCreator:
     """Creates directory structures from FileSystemTree representations."""
 
-    def __init__(self, console: Console | None = None) -> None:
+    def __init__(
+        self, console: Console | None = None, max_workers: int | None = None
+    ) -> None:
         """Initialize the creator.
 
         Parameters
         ----------
         console : Console | None
             Rich console for output, creates new one if None
+        max_workers : int | None
+            Threads used to create wide directory levels and file groups
+            concurrently; 1 creates everything serially. None creates single
+            trees serially and multiple trees with one thread per tree, up
+            to 8
         """
         self.console = Console(safe_box=True)
+        self.max_workers = max_workers
         self.ui = UIComponents(self.console)
 
     def create_structure(
@@ -48,9 +495,15 @@ class TreeCreator:
         base_path: Path = Path("."),
         create_files: bool = True,
         dry_run: bool = False,
+        collect_structure: bool = True,
+        verbose: bool = True,
+        collect_statistics: bool = False,
     ) -> CreationResult:
         """Create directory structure from FileSystemTree.
 
+        The tree is first flattened into directories and files, which are
+        then created in a second pass (directories parents first).
+
         Parameters
         ----------
         tree : FileSystemTree
@@ -61,81 +514,295 @@ class TreeCreator:
             Whether to create files or only directories
         dry_run : bool
             If True, only show what would be created
+        collect_structure : bool
+            Whether to record every created path in the results structure
+        verbose : bool
+            Whether to print progress and errors to the console
+        collect_statistics : bool
+            Whether to group the created files by extension in the results
 
         Returns
         -------
         CreationResult
             Summary of creation results
         """
-        results: CreationResult = {
-            "directories_created": 0,
-            "files_created": 0,
-            "errors": [],
-            "structure": [],
-        }
-
-        # Create the root directory structure
+        plan = _collect_paths(tree.root, _base_prefix(base_path), create_files)
+        results = CreationResult()
+
+        if dry_run:
+            self._summarize(plan, {}, collect_structure, collect_statistics, results)
+            return results
+
         try:
-            self._create_node(tree.root, base_path, create_files, dry_run, results)
-        except Exception as e:
-            error_msg = f"Error creating tree structure: {e}"
-            results["errors"].append(error_msg)
-            self.console.print(f"[red]Error:[/red] {error_msg}")
+            # Ancestors are created once here, nodes only need a plain mkdir
+            base_path.mkdir(parents=True, exist_ok=True)
+        except _FS_ERRORS as e:
+            results.errors.append(f"Error creating tree structure: {e}")
+        else:
+            failed = self._apply(plan, self.max_workers)
+            self._summarize(
+                plan, failed, collect_structure, collect_statistics, results
+            )
 
+        if verbose:
+            self._print_errors(results.errors)
         return results
 
-    def _create_node(
-        self,
-        node: FileSystemNode,
-        base_path: Path,
-        create_files: bool,
-        dry_run: bool,
+    def _apply(
+        self, plan: _CreationPlan, max_workers: int | None
+    ) -> dict[str, str | None]:
+        """Create collected directories and files on disk.
+
+        Parameters
+        ----------
+        plan : _CreationPlan
+            Directories and files to create
+        max_workers : int | None
+            Threads to create wide levels and file groups with, serial if
+            None or 1
+
+        Returns
+        -------
+        dict[str, str | None]
+            Paths that were not created, with their error message, or None
+            when skipped under a failed directory
+        """
+        failed: dict[str, str | None] = {}
+
+        with ExitStack() as stack:
+            executor = None
+            if max_workers is not None and max_workers > 1:
+                executor = stack.enter_context(ThreadPoolExecutor(max_workers))
+
+            self._apply_directories(plan, executor, failed)
+            self._apply_files(plan, executor, failed)
+
+        return failed
+
+    @staticmethod
+    def _apply_directories(
+        plan: _CreationPlan,
+        executor: ThreadPoolExecutor | None,
+        failed: dict[str, str | None],
+    ) -> None:
+        """Create the directories of a plan, one depth level at a time.
+
+        Parameters
+        ----------
+        plan : _CreationPlan
+            Plan whose directories are created
+        executor : ThreadPoolExecutor | None
+            Thread pool for wide levels, or None to create serially
+        failed : dict[str, str | None]
+            Paths that were not created, updated in place
+        """
+        for level in plan.levels:
+            pending = _pending_directories(level, failed)
+            outcomes = _map_jobs(executor, _try_make_dir, pending)
+            for path, error in zip(pending, outcomes, strict=True):
+                if error is not None:
+                    failed[path] = f"Error creating {path}: {error}"
+
+    @staticmethod
+    def _apply_files(
+        plan: _CreationPlan,
+        executor: ThreadPoolExecutor | None,
+        failed: dict[str, str | None],
+    ) -> None:
+        """Write the files of a plan, one job per parent directory.
+
+        Parameters
+        ----------
+        plan : _CreationPlan
+            Plan whose files are written
+        executor : ThreadPoolExecutor | None
+            Thread pool for the file groups, or None to write serially
+        failed : dict[str, str | None]
+            Paths that were not created, updated in place
+        """
+        groups = _pending_file_groups(plan, failed)
+        for errors in _map_jobs(executor, _write_files, groups):
+            for path, error in errors:
+                failed[path] = f"Error creating {path}: {error}"
+
+    @staticmethod
+    def _summarize(
+        plan: _CreationPlan,
+        failed: dict[str, str | None],
+        collect_structure: bool,
+        collect_statistics: bool,
         results: CreationResult,
     ) -> None:
-        """Create a filesystem node and its children.
+        """Fill results from a plan and the paths that failed.
 
         Parameters
         ----------
-        node : FileSystemNode
-            Node to create
+        plan : _CreationPlan
+            Plan that was applied, or only counted on dry runs
+        failed : dict[str, str | None]
+            Paths that were not created, as returned by _apply
+        collect_structure : bool
+            Whether to record created paths in the results structure
+        collect_statistics : bool
+            Whether to group the created files by extension in the results
+        results : CreationResult
+            Results to fill
+        """
+        results.directories_created = sum(len(level) for level in plan.levels)
+        results.files_created = sum(len(files) for _, files in plan.files_by_dir)
+        if collect_statistics:
+            results.files_by_extension = _group_by_extension(plan, failed)
+        if not failed:
+            if collect_structure:
+                results.structure = plan.order
+            return
+
+        directories = [path for level in plan.levels for path, _ in level]
+        files = [path for path, _ in _iter_file_paths(plan)]
+        # Errors follow plan order, which is also the order they occurred
+        results.errors.extend(
+            error
+            for path in chain(directories, files)
+            if (error := failed.get(path)) is not None
+        )
+        results.directories_created -= sum(path in failed for path in directories)
+        results.files_created -= sum(path in failed for path in files)
+        if collect_structure:
+            results.structure = [path for path in plan.order if path not in failed]
+
+    async def create_structure_async(
+        self,
+        tree: FileSystemTree,
+        base_path: Path = Path("."),
+        create_files: bool = True,
+        dry_run: bool = False,
+        collect_structure: bool = True,
+        verbose: bool = True,
+        collect_statistics: bool = False,
+    ) -> CreationResult:
+        """Create directory structure issuing filesystem calls from worker threads.
+
+        Directories are created level by level (a level only starts once its
+        parents exist) and all files are then written concurrently. This pays
+        off when base_path lives on a high-latency filesystem (network, FUSE),
+        where each syscall mostly waits.
+
+        Parameters
+        ----------
+        tree : FileSystemTree
+            File system tree to create
         base_path : Path
-            Base directory path
+            Base directory to create structure in
         create_files : bool
-            Whether to create files
+            Whether to create files or only directories
         dry_run : bool
-            Whether this is a dry run
-        results : dict[str, Any]
-            Results dictionary to update
+            If True, only show what would be created
+        collect_structure : bool
+            Whether to record every created path in the results structure
+        verbose : bool
+            Whether to print progress and errors to the console
+        collect_statistics : bool
+            Whether to group the created files by extension in the results
+
+        Returns
+        -------
+        CreationResult
+            Summary of creation results
         """
-        node_path = base_path / node.name
+        plan = _collect_paths(tree.root, _base_prefix(base_path), create_files)
+        results = CreationResult()
+
+        if dry_run:
+            self._summarize(plan, {}, collect_structure, collect_statistics, results)
+            return results
 
         try:
-            if isinstance(node, FileNode):
-                if create_files:
-                    if not dry_run:
-                        node_path.parent.mkdir(parents=True, exist_ok=True)
-                        node_path.touch()
-                        if node.content:
-                            node_path.write_text(node.content)
+            await asyncio.to_thread(base_path.mkdir, parents=True, exist_ok=True)
+        except _FS_ERRORS as e:
+            results.errors.append(f"Error creating tree structure: {e}")
+            if verbose:
+                self._print_errors(results.errors)
+            return results
+
+        # Same bookkeeping as _apply: nodes under a failed directory are
+        # recorded as skipped instead of attempted
+        failed: dict[str, str | None] = {}
+
+        for level in plan.levels:
+            await self._run_in_threads(
+                [
+                    (path, partial(_make_dir, path))
+                    for path in _pending_directories(level, failed)
+                ],
+                failed,
+            )
 
-                    results["files_created"] += 1
-                    results["structure"].append(str(node_path))
+        jobs: list[tuple[str, Callable[[], None]]] = []
+        for dir_path, dir_files in _pending_file_groups(plan, failed):
+            prefix = dir_path + os.sep
+            for name, content in dir_files:
+                path = prefix + name
+                jobs.append((path, partial(_write_file, path, content)))
+        await self._run_in_threads(jobs, failed)
+
+        self._summarize(plan, failed, collect_structure, collect_statistics, results)
+        if verbose:
+            self._print_errors(results.errors)
+        return results
 
-            elif isinstance(node, DirectoryNode):
-                if not dry_run:
-                    node_path.mkdir(parents=True, exist_ok=True)
+    async def _run_in_threads(
+        self,
+        jobs: list[tuple[str, Callable[[], None]]],
+        failed: dict[str, str | None],
+    ) -> None:
+        """Run filesystem jobs concurrently in worker threads.
 
-                results["directories_created"] += 1
-                results["structure"].append(str(node_path))
+        Parameters
+        ----------
+        jobs : list[tuple[str, Callable[[], None]]]
+            Target paths with the job creating each of them
+        failed : dict[str, str | None]
+            Paths that were not created, updated in place
+        """
+        outcomes = await asyncio.gather(
+            *(asyncio.to_thread(job) for _, job in jobs), return_exceptions=True
+        )
 
-                # Recursively create children
-                for child in node.children:
-                    self._create_node(child, node_path, create_files, dry_run, results)
+        for (path, _), outcome in zip(jobs, outcomes, strict=True):
+            if isinstance(outcome, _FS_ERRORS):
+                failed[path] = f"Error creating {path}: {outcome}"
+            elif isinstance(outcome, BaseException):
+                raise outcome
 
-        except Exception as e:
-            error_msg = f"Error creating {node_path}: {e}"
-            results["errors"].append(error_msg)
-            self.console.print(f"[red]Error:[/red] {error_msg}")
+    def _print_errors(self, errors: list[str]) -> None:
+        """Print all errors of a run in a single console call.
+
+        Parameters
+        ----------
+        errors : list[str]
+            Error messages to print
+        """
+        if errors:
+            self.console.print(Text("\n").join(self._format_errors(errors)))
+
+    @staticmethod
+    def _format_errors(errors: list[str]) -> list[Text]:
+        """Format error messages as console lines.
+
+        Lines are styled Text rather than markup strings, so Rich skips
+        markup parsing and highlighting, and brackets in paths print as is.
+
+        Parameters
+        ----------
+        errors : list[str]
+            Error messages to format
+
+        Returns
+        -------
+        list[Text]
+            One styled line per error
+        """
+        return [Text.assemble(("Error:", "red"), " ", error) for error in errors]
 
     def create_multiple_structures(
         self,
@@ -143,9 +810,15 @@ class TreeCreator:
         base_path: Path = Path("."),
         create_files: bool = True,
         dry_run: bool = False,
+        collect_structure: bool = True,
+        verbose: bool = True,
+        collect_statistics: bool = False,
     ) -> list[MultipleCreationResult]:
         """Create multiple tree structures with numbered directories.
 
+        Trees are created concurrently by default: unless max_workers was
+        given, one thread is used per tree, up to 8.
+
         Parameters
         ----------
         trees : list[FileSystemTree]
@@ -156,29 +829,60 @@ class TreeCreator:
             Whether to create files or only directories
         dry_run : bool
             If True, only show what would be created
+        collect_structure : bool
+            Whether to record every created path in the results structure
+        verbose : bool
+            Whether to print progress and errors to the console
+        collect_statistics : bool
+            Whether to group the created files by extension in the results
 
         Returns
         -------
         list[MultipleCreationResult]
             List of creation results for each tree
         """
-        results: list[MultipleCreationResult] = []
+        if not trees:
+            return []
+
+        # All trees are flattened into one plan under their numbered
+        # directories and created in a single pass
+        base = _base_prefix(base_path)
+        roots = [os.path.join(base, f"tree_{i:02d}") for i in range(1, len(trees) + 1)]
+        plans = [
+            _collect_paths(tree.root, root, create_files)
+            for tree, root in zip(trees, roots, strict=True)
+        ]
+
+        failed: dict[str, str | None] = {}
+        if not dry_run:
+            try:
+                base_path.mkdir(parents=True, exist_ok=True)
+            except _FS_ERRORS as e:
+                failed = {root: f"Error creating tree structure: {e}" for root in roots}
+            else:
+                # Trees are independent, so the pass is threaded by default
+                workers = self.max_workers or min(8, len(trees))
+                failed = self._apply(_merge_plans(base, roots, plans), workers)
 
-        for i, tree in enumerate(trees, 1):
-            # Create numbered directory for each tree
-            numbered_base = base_path / f"tree_{i:02d}"
-
-            self.console.print(
-                f"\n[bold yellow]Creating tree {i}/{len(trees)}:[/bold yellow]"
-            )
-
-            result = self.create_structure(tree, numbered_base, create_files, dry_run)
-            # Convert to MultipleCreationResult by adding tree_number
-            multi_result: MultipleCreationResult = {
-                **result,
-                "tree_number": i,
-            }
-            results.append(multi_result)
+        results: list[MultipleCreationResult] = []
+        for i, (root, plan) in enumerate(zip(roots, plans, strict=True), 1):
+            result = MultipleCreationResult(tree_number=i)
+            if (root_error := failed.get(root)) is not None:
+                result.errors.append(root_error)
+            else:
+                self._summarize(
+                    plan, failed, collect_structure, collect_statistics, result
+                )
+            results.append(result)
+
+        if verbose:
+            # Buffer banners and errors of all trees into a single print
+            lines: list[Text] = []
+            for result in results:
+                banner = f"Creating tree {result.tree_number}/{len(trees)}:"
+                lines.append(Text.assemble("\n", (banner, "bold yellow")))
+                lines.extend(self._format_errors(result.errors))
+            self.console.print(Text("\n").join(lines))
 
         return results
 
@@ -192,19 +896,21 @@ class TreeCreator:
         """
         self.ui.display_tree_preview(tree)
 
-    def create_file_statistics_table(self, tree: FileSystemTree) -> Table:
+    def create_file_statistics_table(
+        self, source: FileSystemTree | CreationResult
+    ) -> Table:
         """Create file statistics table with Rich formatting.
 
         Parameters
         ----------
-        tree : FileSystemTree
-            File system tree to analyze
+        source : FileSystemTree | CreationResult
+            File system tree to analyze, or results from create_structure
 
         Returns
         -------
         Rich table with file statistics
         """
-        return self.ui.create_file_statistics_table(tree)
+        return self.ui.create_file_statistics_table(source)
 
     def print_summary(self, results: CreationResult) -> None:
         """Print creation summary with Rich Panel formatting.
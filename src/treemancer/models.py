@@ -8,6 +8,7 @@ from dataclasses import dataclass
 import json
 from pathlib import Path
 from typing import Any
+from typing import ClassVar
 from typing import NotRequired
 from typing import TypedDict
 from typing import cast
@@ -81,6 +82,10 @@ class DirectoryConfig(NodeConfig):
 class FileSystemNode(ABC):
     """Abstract base class for file system nodes."""
 
+    # Node kind tag for hot traversals; isinstance against these ABC-derived
+    # classes goes through ABCMeta.__instancecheck__ and is several times slower
+    is_directory: ClassVar[bool] = False
+
     def __init__(self, name: str, parent: DirectoryNode | None = None) -> None:
         self.name = name
         self.parent = parent
@@ -172,9 +177,15 @@ class FileNode(FileSystemNode):
 class DirectoryNode(FileSystemNode):
     """Represents a directory in the tree structure."""
 
+    is_directory: ClassVar[bool] = True
+
     def __init__(self, name: str, parent: DirectoryNode | None = None) -> None:
         super().__init__(name, parent)
         self.children: list[FileSystemNode] = []
+        # Children partitioned by type, kept in sync with children so
+        # traversals can skip per-child type checks
+        self.files: list[FileNode] = []
+        self.subdirs: list[DirectoryNode] = []
         self._children_by_name: dict[str, FileSystemNode] = {}
 
     @classmethod
@@ -192,6 +203,10 @@ class DirectoryNode(FileSystemNode):
 
         child.parent = self
         self.children.append(child)
+        if child.is_directory:
+            self.subdirs.append(cast(DirectoryNode, child))
+        else:
+            self.files.append(cast(FileNode, child))
         self._children_by_name[child.name] = child
 
     def remove_child(self, name: str) -> FileSystemNode | None:
@@ -201,6 +216,10 @@ class DirectoryNode(FileSystemNode):
 
         child = self._children_by_name[name]
         self.children.remove(child)
+        if child.is_directory:
+            self.subdirs.remove(cast(DirectoryNode, child))
+        else:
+            self.files.remove(cast(FileNode, child))
         del self._children_by_name[name]
         child.parent = None
         return child
@@ -211,11 +230,11 @@ class DirectoryNode(FileSystemNode):
 
     def get_files(self) -> list[FileNode]:
         """Get all file children."""
-        return [child for child in self.children if isinstance(child, FileNode)]
+        return list(self.files)
 
     def get_directories(self) -> list[DirectoryNode]:
         """Get all directory children."""
-        return [child for child in self.children if isinstance(child, DirectoryNode)]
+        return list(self.subdirs)
 
     def create_file(
         self, name: str, content: str | None = None, size: int | None = None
@@ -252,11 +271,16 @@ class DirectoryNode(FileSystemNode):
     def get_all_files(self) -> list[FileNode]:
         """Get all files recursively in this directory tree."""
         files: list[FileNode] = []
-        for child in self.children:
-            if isinstance(child, FileNode):
-                files.append(child)
-            elif isinstance(child, DirectoryNode):
-                files.extend(child.get_all_files())
+        # Stack of child iterators keeps depth-first order without recursion
+        stack = [iter(self.children)]
+        while stack:
+            for child in stack[-1]:
+                if child.is_directory:
+                    stack.append(iter(cast(DirectoryNode, child).children))
+                    break
+                files.append(cast(FileNode, child))
+            else:
+                stack.pop()
         return files
 
     def to_dict(self) -> DirectoryNodeData:
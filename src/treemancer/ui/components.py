@@ -1,7 +1,8 @@
 """Enchanted UI components that bring TreeMancer spells to life."""
 
-from pathlib import Path
+from functools import lru_cache
 from typing import TYPE_CHECKING
+from typing import cast
 
 from rich.box import ROUNDED
 from rich.console import Console
@@ -14,6 +15,7 @@ from rich.table import Table
 from rich.tree import Tree as RichTree
 
 from treemancer.ui.styles import FileStyler
+from treemancer.ui.styles import get_extension
 
 
 if TYPE_CHECKING:
@@ -23,6 +25,55 @@ if TYPE_CHECKING:
     from treemancer.models import FileSystemTree
 
 
+# Label templates per (icon, color) style, rendered with a single % operation.
+# Only a few dozen styles exist, so these stay small.
+_FILE_LABEL_TEMPLATES: dict[tuple[str, str], str] = {}
+_DIR_LABEL_TEMPLATES: dict[tuple[str, str], str] = {}
+
+
+@lru_cache(maxsize=1024)
+def _file_label(name: str) -> str:
+    """Build the styled tree label of a file.
+
+    Parameters
+    ----------
+    name : str
+        File name
+
+    Returns
+    -------
+    str
+        Label with icon and color markup
+    """
+    style = FileStyler.get_file_style(name)
+    template = _FILE_LABEL_TEMPLATES.get(style)
+    if template is None:
+        icon, color = style
+        template = _FILE_LABEL_TEMPLATES[style] = f"{icon} [{color}]%s[/{color}]"
+    return template % name
+
+
+@lru_cache(maxsize=1024)
+def _dir_label(name: str) -> str:
+    """Build the tree label of a directory.
+
+    Parameters
+    ----------
+    name : str
+        Directory name
+
+    Returns
+    -------
+    str
+        Label with icon
+    """
+    style = FileStyler.get_directory_style(name)
+    template = _DIR_LABEL_TEMPLATES.get(style)
+    if template is None:
+        template = _DIR_LABEL_TEMPLATES[style] = f"{style[0]} %s"
+    return template % name
+
+
 class UIComponents:
     """Rich UI components and utilities for TreeMancer."""
 
@@ -55,33 +106,32 @@ class UIComponents:
             Rich tree representation
         """
         from treemancer.models import DirectoryNode
-        from treemancer.models import FileNode
 
         if rich_tree is None:
-            if isinstance(node, FileNode):
-                icon, color = self.styler.get_file_style(node.name)
-                display_name = f"{icon} [{color}]{node.name}[/{color}]"
+            if isinstance(node, DirectoryNode):
+                rich_tree = RichTree(_dir_label(node.name))
             else:
-                icon, color = self.styler.get_directory_style(node.name)
-                display_name = f"{icon} {node.name}"
-            rich_tree = RichTree(display_name)
+                rich_tree = RichTree(_file_label(node.name))
 
         # Only DirectoryNode has children
-        if isinstance(node, DirectoryNode):
-            for child in node.children:
-                if isinstance(child, FileNode):
-                    icon, color = self.styler.get_file_style(child.name)
-                    rich_tree.add(f"{icon} [{color}]{child.name}[/{color}]")
+        if not isinstance(node, DirectoryNode):
+            return rich_tree
+
+        stack: list[tuple[DirectoryNode, RichTree]] = [(node, rich_tree)]
+        while stack:
+            directory, branch = stack.pop()
+            for child in directory.children:
+                if child.is_directory:
+                    child_branch = branch.add(_dir_label(child.name))
+                    stack.append((cast(DirectoryNode, child), child_branch))
                 else:
-                    icon, color = self.styler.get_directory_style(child.name)
-                    child_display = f"{icon} {child.name}"
-                    child_tree = rich_tree.add(child_display)
-                    self.build_rich_tree(child, child_tree)
+                    branch.add(_file_label(child.name))
 
         return rich_tree
 
-    def create_file_statistics_table(self, tree: "FileSystemTree") -> Table:
-        """Create file statistics table with Rich formatting.
+    @staticmethod
+    def collect_file_statistics(tree: "FileSystemTree") -> dict[str, list[str]]:
+        """Group file names of a tree by their lowercase extension.
 
         Parameters
         ----------
@@ -90,26 +140,46 @@ class UIComponents:
 
         Returns
         -------
-        Table
-            Rich table with file statistics
+        dict[str, list[str]]
+            File names keyed by extension ("no extension" when missing)
         """
         from treemancer.models import DirectoryNode
-        from treemancer.models import FileNode
 
-        # Count files by extension
         file_counts: dict[str, list[str]] = {}
+        stack: list[DirectoryNode] = [tree.root]
 
-        def count_files_recursive(node: "FileSystemNode") -> None:
-            if isinstance(node, FileNode):
-                extension = Path(node.name).suffix.lower() or "no extension"
-                if extension not in file_counts:
-                    file_counts[extension] = []
-                file_counts[extension].append(node.name)
-            elif isinstance(node, DirectoryNode):
-                for child in node.children:
-                    count_files_recursive(child)
+        while stack:
+            node = stack.pop()
+            for file_node in node.files:
+                extension = get_extension(file_node.name) or "no extension"
+                file_counts.setdefault(extension, []).append(file_node.name)
+            # Reversed so subdirectories are visited in their original order
+            stack.extend(reversed(node.subdirs))
 
-        count_files_recursive(tree.root)
+        return file_counts
+
+    def create_file_statistics_table(
+        self, source: "FileSystemTree | CreationResult"
+    ) -> Table:
+        """Create file statistics table with Rich formatting.
+
+        Parameters
+        ----------
+        source : FileSystemTree | CreationResult
+            File system tree to analyze, or creation results run with
+            collect_statistics, grouping the files that were created
+
+        Returns
+        -------
+        Table
+            Rich table with file statistics
+        """
+        from treemancer.models import FileSystemTree
+
+        if isinstance(source, FileSystemTree):
+            file_counts = self.collect_file_statistics(source)
+        else:
+            file_counts = source.files_by_extension
 
         # Create table
         table = Table(expand=True, box=ROUNDED)
@@ -142,23 +212,23 @@ class UIComponents:
         Panel
             Rich panel with formatted summary
         """
-        total_items = results["directories_created"] + results["files_created"]
+        total_items = results.directories_created + results.files_created
 
         # Build summary content
         summary_lines = [
             f"📁 Directories created: "
-            f"[bold blue]{results['directories_created']}[/bold blue]",
-            f"📄 Files created: [bold green]{results['files_created']}[/bold green]",
+            f"[bold blue]{results.directories_created}[/bold blue]",
+            f"📄 Files created: [bold green]{results.files_created}[/bold green]",
             f"✨ Total items: [bold cyan]{total_items}[/bold cyan]",
         ]
 
         summary_content = "\n".join(summary_lines)
 
-        if results["errors"]:
+        if results.errors:
             # Show summary with errors
-            error_details = "\n".join([f"• {error}" for error in results["errors"]])
+            error_details = "\n".join([f"• {error}" for error in results.errors])
             error_section = (
-                f"[red]❌ Errors ({len(results['errors'])}):[/red]\n{error_details}"
+                f"[red]❌ Errors ({len(results.errors)}):[/red]\n{error_details}"
             )
             full_content = f"{summary_content}\n\n{error_section}"
 
@@ -194,9 +264,9 @@ class UIComponents:
         Panel
             Rich panel with formatted summary
         """
-        total_dirs = sum(r["directories_created"] for r in results_list)
-        total_files = sum(r["files_created"] for r in results_list)
-        total_errors = sum(len(r["errors"]) for r in results_list)
+        total_dirs = sum(r.directories_created for r in results_list)
+        total_files = sum(r.files_created for r in results_list)
+        total_errors = sum(len(r.errors) for r in results_list)
         total_items = total_dirs + total_files
 
         # Build summary content
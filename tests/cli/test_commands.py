@@ -8,10 +8,12 @@ from typer.testing import CliRunner
 from treemancer.cli import app
 
 
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+
+
 def _strip_ansi_codes(text: str) -> str:
     """Remove ANSI escape codes from text for testing purposes."""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ANSI_RE.sub("", text)
 
 
 class TestCliCommands:
@@ -1,183 +1,178 @@
 """Tests for CLI integration with TreeMancer structural syntax."""
 
+import os
 from pathlib import Path
 import re
 import subprocess
-import tempfile
+
+import pytest
+from typer.testing import CliRunner
+from typer.testing import Result
+
+from treemancer.cli import app
+
+
+_ANSI_RE = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
+_ANSI_BYTES_RE = re.compile(_ANSI_RE.pattern.encode())
 
 
 def _strip_ansi_codes(text: str) -> str:
     """Remove ANSI escape codes from text for testing purposes."""
-    ansi_escape = re.compile(r"\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])")
-    return ansi_escape.sub("", text)
+    return _ANSI_RE.sub("", text)
 
 
-class TestCliIntegration:
-    """Test CLI integration with TreeMancer structural syntax."""
+_RUNNER = CliRunner()
 
-    def test_create_help(self):
-        """Test that create command shows help."""
-        result = subprocess.run(
-            ["uv", "run", "treemancer", "create", "--help"],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
-        assert result.returncode == 0
-        # Strip ANSI codes before checking content
-        clean_output = _strip_ansi_codes(result.stdout).lower()
-        assert "create" in clean_output
-        assert "syntax or file" in clean_output
 
-    def test_from_syntax_dry_run(self):
-        """Test dry run functionality with TreeMancer structural syntax."""
-        result = subprocess.run(
-            [
-                "uv",
-                "run",
-                "treemancer",
-                "create",
-                "project > d(src) > main.py | d(utils) > helper.py",
-                "--dry-run",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+def _invoke(*args: str) -> Result:
+    """Run the treemancer CLI in process with the given arguments."""
+    return _RUNNER.invoke(app, list(args))
 
-        assert result.returncode == 0
 
-    def test_from_syntax_with_type_hints(self):
-        """Test parsing TreeMancer structural syntax with type hints."""
-        result = subprocess.run(
-            [
-                "uv",
-                "run",
-                "treemancer",
-                "create",
-                "app > d(src) > f(main.py) | d(tests) > f(test_main.py)",
-                "--dry-run",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
-        )
+def _walk_tree(root: Path) -> tuple[set[str], set[str]]:
+    """Collect the directories and files under root in a single walk."""
+    dirs: set[str] = set()
+    files: set[str] = set()
+    for dirpath, dirnames, filenames in os.walk(root):
+        rel = Path(dirpath).relative_to(root)
+        dirs.update((rel / name).as_posix() for name in dirnames)
+        files.update((rel / name).as_posix() for name in filenames)
+    return dirs, files
+
+
+@pytest.fixture(scope="module")
+def shared_tmp(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Provide one temporary directory shared by the tests of this module."""
+    return tmp_path_factory.mktemp("cli_integration")
+
+
+@pytest.fixture(scope="module")
+def create_help() -> str:
+    """Render the create command help once for the tests of this module."""
+    result = _invoke("create", "--help")
+    assert result.exit_code == 0
+    # Strip ANSI codes so tests can check plain content
+    return _strip_ansi_codes(result.stdout)
+
+
+@pytest.fixture
+def output_path(shared_tmp: Path, request: pytest.FixtureRequest) -> Path:
+    """Provide an output path unique to the requesting test."""
+    return shared_tmp / request.function.__name__
 
-        assert result.returncode == 0
 
-    def test_from_syntax_error_handling(self):
-        """Test error handling for malformed TreeMancer structural syntax."""
+class TestCliIntegration:
+    """Test CLI integration with TreeMancer structural syntax."""
+
+    def test_installed_script_help(self) -> None:
+        """Test the installed treemancer script end to end."""
         result = subprocess.run(
-            [
-                "uv",
-                "run",
-                "treemancer",
-                "create",
-                "invalid > > missing_name",
-            ],
+            ["uv", "run", "treemancer", "create", "--help"],
             capture_output=True,
-            text=True,
             check=False,
         )
+        assert result.returncode == 0
+        # Strip ANSI codes before checking content; the checks are ASCII,
+        # so the raw bytes never need decoding
+        clean_output = _ANSI_BYTES_RE.sub(b"", result.stdout).lower()
+        assert b"create" in clean_output
+        assert b"syntax or file" in clean_output
 
-        assert result.returncode != 0
-        # Strip ANSI codes before checking error content
-        clean_stderr = _strip_ansi_codes(result.stderr).lower()
-        clean_stdout = _strip_ansi_codes(result.stdout).lower()
-        assert "error" in clean_stderr or "error" in clean_stdout
-
-    def test_from_syntax_actual_creation(self):
-        """Test actual directory creation with TreeMancer structural syntax."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "test_output"
+    def test_create_help(self, create_help: str) -> None:
+        """Test that create command shows help."""
+        clean_output = create_help.lower()
+        assert "create" in clean_output
+        assert "syntax or file" in clean_output
 
-            result = subprocess.run(
+    @pytest.mark.parametrize(
+        ("argv", "expected"),
+        [
+            pytest.param(
                 [
-                    "uv",
-                    "run",
-                    "treemancer",
                     "create",
-                    "testproject > d(src) > app.py | d(tests) > test_app.py",
-                    "--output",
-                    str(output_path),
+                    "project > d(src) > main.py | d(utils) > helper.py",
+                    "--dry-run",
                 ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
-
-            assert result.returncode == 0
-
-            # Verify structure was created (tests is sibling of src due to
-            # cascade reset going back to testproject)
-            assert (output_path / "testproject").is_dir()
-            assert (output_path / "testproject" / "src").is_dir()
-            assert (output_path / "testproject" / "tests").is_dir()
-            assert (output_path / "testproject" / "src" / "app.py").exists()
-            assert (output_path / "testproject" / "tests" / "test_app.py").exists()
-
-    def test_from_syntax_no_files_option(self):
-        """Test --no-files option with TreeMancer structural syntax."""
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "test_output"
-
-            result = subprocess.run(
+                ["dry run mode on", "Directories created: 3", "Files created: 2"],
+                id="dry-run",
+            ),
+            pytest.param(
                 [
-                    "uv",
-                    "run",
-                    "treemancer",
                     "create",
-                    "project > d(src) > main.py | d(docs) > readme.md",
-                    "--output",
-                    str(output_path),
-                    "--no-files",
+                    "app > d(src) > f(main.py) | d(tests) > f(test_main.py)",
+                    "--dry-run",
                 ],
-                capture_output=True,
-                text=True,
-                check=False,
-            )
+                ["dry run mode on", "Directories created: 3", "Files created: 2"],
+                id="type-hints",
+            ),
+            pytest.param(
+                ["preview", "app > main.py | config.py"],
+                ["app", "main.py", "config.py"],
+                id="preview",
+            ),
+        ],
+    )
+    def test_from_syntax_without_creation(
+        self, argv: list[str], expected: list[str]
+    ) -> None:
+        """Test dry runs and previews of TreeMancer structural syntax."""
+        result = _invoke(*argv)
 
-            assert result.returncode == 0
+        assert result.exit_code == 0
+        clean_output = _strip_ansi_codes(result.stdout)
+        assert all(text in clean_output for text in expected), clean_output
 
-            # Verify only directories were created (docs is sibling of src
-            # due to cascade reset going back to project)
-            assert (output_path / "project").is_dir()
-            assert (output_path / "project" / "src").is_dir()
-            assert (output_path / "project" / "docs").is_dir()
+    def test_from_syntax_error_handling(self) -> None:
+        """Test that the CLI surfaces parse errors with a nonzero exit.
 
-            # Verify no files were created
-            assert not (output_path / "project" / "src" / "main.py").exists()
-            assert not (output_path / "project" / "docs" / "readme.md").exists()
+        The parse error itself is covered at the parser level in
+        tests/languages/test_structural.py.
+        """
+        result = _invoke("create", "invalid > > missing_name")
 
-    def test_preview_syntax(self):
-        """Test preview command shows tree structure."""
-        result = subprocess.run(
-            [
-                "uv",
-                "run",
-                "treemancer",
-                "preview",
-                "app > main.py | config.py",
-            ],
-            capture_output=True,
-            text=True,
-            check=False,
+        assert result.exit_code != 0
+        # Strip ANSI codes before checking error content
+        clean_output = _strip_ansi_codes(result.output).lower()
+        assert "error" in clean_output
+
+    def test_from_syntax_actual_creation(self, output_path: Path) -> None:
+        """Test actual directory creation with TreeMancer structural syntax."""
+        result = _invoke(
+            "create",
+            "testproject > d(src) > app.py | d(tests) > test_app.py",
+            "--output",
+            str(output_path),
         )
 
-        assert result.returncode == 0
+        assert result.exit_code == 0
 
+        # Verify structure was created (tests is sibling of src due to
+        # cascade reset going back to testproject)
+        dirs, files = _walk_tree(output_path)
+        assert dirs == {"testproject", "testproject/src", "testproject/tests"}
+        assert files == {"testproject/src/app.py", "testproject/tests/test_app.py"}
 
-class TestConvertIntegration:
-    """Test cases for convert command integration."""
+    def test_from_syntax_no_files_option(self, output_path: Path) -> None:
+        """Test --no-files option with TreeMancer structural syntax."""
+        result = _invoke(
+            "create",
+            "project > d(src) > main.py | d(docs) > readme.md",
+            "--output",
+            str(output_path),
+            "--no-files",
+        )
 
-    def setup_method(self) -> None:
-        """Set up test fixtures."""
-        from typer.testing import CliRunner
+        assert result.exit_code == 0
 
-        from treemancer.cli import app
+        # Verify only directories were created (docs is sibling of src
+        # due to cascade reset going back to project)
+        dirs, files = _walk_tree(output_path)
+        assert dirs == {"project", "project/src", "project/docs"}
+        assert files == set()
 
-        self.runner = CliRunner()
-        self.app = app
+
+class TestConvertIntegration:
+    """Test cases for convert command integration."""
 
     def test_round_trip_conversion(
         self, sample_syntax_file: Path, temp_dir: Path
@@ -185,15 +180,12 @@ class TestConvertIntegration:
         """Test round-trip conversion: syntax -> diagram -> syntax."""
         # First conversion: syntax to diagram
         diagram_file = temp_dir / "diagram.md"
-        result1 = self.runner.invoke(
-            self.app,
-            [
-                "convert",
-                str(sample_syntax_file),
-                "--to-diagram",
-                "--output",
-                str(diagram_file),
-            ],
+        result1 = _invoke(
+            "convert",
+            str(sample_syntax_file),
+            "--to-diagram",
+            "--output",
+            str(diagram_file),
         )
 
         assert result1.exit_code == 0
@@ -201,15 +193,12 @@ class TestConvertIntegration:
 
         # Second conversion: diagram back to syntax
         converted_syntax_file = temp_dir / "converted.tree"
-        result2 = self.runner.invoke(
-            self.app,
-            [
-                "convert",
-                str(diagram_file),
-                "--to-syntax",
-                "--output",
-                str(converted_syntax_file),
-            ],
+        result2 = _invoke(
+            "convert",
+            str(diagram_file),
+            "--to-syntax",
+            "--output",
+            str(converted_syntax_file),
         )
 
         assert result2.exit_code == 0
@@ -229,15 +218,12 @@ class TestConvertIntegration:
         """Test TreeMancer syntax generation through CLI integration."""
         output_file = temp_dir / "converted.tree"
 
-        result = self.runner.invoke(
-            self.app,
-            [
-                "convert",
-                str(sample_markdown_file),
-                "--to-syntax",
-                "--output",
-                str(output_file),
-            ],
+        result = _invoke(
+            "convert",
+            str(sample_markdown_file),
+            "--to-syntax",
+            "--output",
+            str(output_file),
         )
 
         assert result.exit_code == 0
@@ -257,16 +243,13 @@ class TestConvertIntegration:
         """Test multiple tree conversion through CLI integration."""
         output_file = temp_dir / "multi.tree"
 
-        result = self.runner.invoke(
-            self.app,
-            [
-                "convert",
-                str(multi_tree_markdown_file),
-                "--to-syntax",
-                "--all-trees",
-                "--output",
-                str(output_file),
-            ],
+        result = _invoke(
+            "convert",
+            str(multi_tree_markdown_file),
+            "--to-syntax",
+            "--all-trees",
+            "--output",
+            str(output_file),
         )
 
         assert result.exit_code == 0
@@ -283,14 +266,11 @@ class TestConvertIntegration:
         self, multi_tree_markdown_file: Path
     ) -> None:
         """Test terminal output through CLI integration."""
-        result = self.runner.invoke(
-            self.app,
-            [
-                "convert",
-                str(multi_tree_markdown_file),
-                "--to-syntax",
-                "--all-trees",
-            ],
+        result = _invoke(
+            "convert",
+            str(multi_tree_markdown_file),
+            "--to-syntax",
+            "--all-trees",
         )
 
         assert result.exit_code == 0
@@ -1,5 +1,6 @@
 """Tests for TreeCreator module."""
 
+import os
 from pathlib import Path
 
 import pytest
@@ -26,9 +27,9 @@ class TestTreeCreator:
         )
 
         # Check results
-        assert results["directories_created"] == 4  # project, src, package, tests
-        assert results["files_created"] == 0
-        assert len(results["errors"]) == 0
+        assert results.directories_created == 4  # project, src, package, tests
+        assert results.files_created == 0
+        assert len(results.errors) == 0
 
         # Check actual directory creation
         project_dir = temp_dir / "project"
@@ -63,9 +64,9 @@ class TestTreeCreator:
         )
 
         # Check results
-        assert results["directories_created"] == 4
-        assert results["files_created"] == 8  # All files in sample_tree
-        assert len(results["errors"]) == 0
+        assert results.directories_created == 4
+        assert results.files_created == 8  # All files in sample_tree
+        assert len(results.errors) == 0
 
         # Check directory creation
         project_dir = temp_dir / "project"
@@ -105,9 +106,9 @@ class TestTreeCreator:
         )
 
         # Check results show what would be created
-        assert results["directories_created"] == 4
-        assert results["files_created"] == 8
-        assert len(results["errors"]) == 0
+        assert results.directories_created == 4
+        assert results.files_created == 8
+        assert len(results.errors) == 0
 
         # Check that nothing was actually created
         project_dir = temp_dir / "project"
@@ -124,13 +125,17 @@ class TestTreeCreator:
 
         trees = [sample_filesystem_tree, simple_tree]
         results_list = self.creator.create_multiple_structures(
-            trees, temp_dir, create_files=True
+            trees, temp_dir, create_files=True, collect_statistics=True
         )
 
         # Check results
         assert len(results_list) == 2
-        assert results_list[0]["tree_number"] == 1
-        assert results_list[1]["tree_number"] == 2
+        assert results_list[0].tree_number == 1
+        assert results_list[1].tree_number == 2
+        assert results_list[1].files_created == 2
+        assert results_list[1].files_by_extension == {
+            ".txt": ["file1.txt", "file2.txt"]
+        }
 
         # Check directory creation
         tree_01_dir = temp_dir / "tree_01" / "project"
@@ -163,7 +168,7 @@ class TestTreeCreator:
         results = self.creator.create_structure(tree, temp_dir, create_files=True)
 
         # Should have at least one error
-        assert len(results["errors"]) > 0
+        assert len(results.errors) > 0
 
         # Root directory should still be created
         root_dir = temp_dir / "root"
@@ -188,7 +193,7 @@ class TestTreeCreator:
         )
 
         # Should succeed without errors (mkdir with exist_ok=True)
-        assert len(results["errors"]) == 0
+        assert len(results.errors) == 0
 
         # Directory should still exist
         assert project_dir.exists()
@@ -209,12 +214,12 @@ class TestTreeCreator:
         """Test summary printing."""
         from treemancer.creator import CreationResult
 
-        results: CreationResult = {
-            "directories_created": 3,
-            "files_created": 2,
-            "errors": ["test error"],
-            "structure": ["/path1", "/path2"],
-        }
+        results = CreationResult(
+            directories_created=3,
+            files_created=2,
+            errors=["test error"],
+            structure=["/path1", "/path2"],
+        )
 
         # Should not raise any exceptions
         try:
@@ -233,8 +238,8 @@ class TestTreeCreator:
         )
 
         # Should create parent directories
-        assert results["directories_created"] >= 4  # At least the tree directories
-        assert len(results["errors"]) == 0
+        assert results.directories_created >= 4  # At least the tree directories
+        assert len(results.errors) == 0
 
         # Check creation in custom location
         project_dir = custom_base / "project"
@@ -251,3 +256,416 @@ class TestTreeCreator:
             assert rich_tree is not None
         except Exception as e:
             pytest.fail(f"Rich tree building failed: {e}")
+
+    def test_build_rich_tree_keeps_child_order(self) -> None:
+        """Test that nested children keep their order in the Rich tree."""
+        tree = FileSystemTree("root")
+        src = tree.root.create_directory("src")
+        src.create_file("main.py")
+        src.create_directory("utils").create_file("helpers.py")
+        tree.root.create_file("README.md")
+
+        rich_tree = self.creator.ui.build_rich_tree(tree.root)
+
+        assert str(rich_tree.label).endswith(" root")
+        src_branch, readme = rich_tree.children
+        assert str(src_branch.label).endswith(" src")
+        assert "README.md" in str(readme.label)
+        main, utils = src_branch.children
+        assert "main.py" in str(main.label)
+        assert "helpers.py" in str(utils.children[0].label)
+
+    def test_creation_result_to_dict(self) -> None:
+        """Test creation result conversion to dictionary."""
+        from treemancer.creator import CreationResult
+
+        results = CreationResult(directories_created=1, structure=["/path1"])
+
+        assert results.to_dict() == {
+            "directories_created": 1,
+            "files_created": 0,
+            "errors": [],
+            "structure": ["/path1"],
+            "files_by_extension": {},
+        }
+        assert not hasattr(results, "__dict__")
+
+    def test_multi_segment_directory_names(self, temp_dir: Path) -> None:
+        """Test that directory names spanning several segments are created."""
+        tree = FileSystemTree("root")
+        tree.root.create_directory("src/utils").create_file("a.py")
+
+        results = self.creator.create_structure(tree, temp_dir)
+
+        assert results.errors == []
+        assert results.directories_created == 2
+        assert results.files_created == 1
+        assert (temp_dir / "root" / "src" / "utils" / "a.py").is_file()
+
+    def test_multi_segment_directory_under_failed_parent(self, temp_dir: Path) -> None:
+        """Test that a multi-segment name is skipped when its parent failed."""
+        tree = FileSystemTree("root")
+        blocked = tree.root.create_directory("blocked")
+        blocked.create_directory("src/utils")
+
+        (temp_dir / "root").mkdir()
+        (temp_dir / "root" / "blocked").write_text("not a directory")
+
+        results = self.creator.create_structure(tree, temp_dir)
+
+        assert len(results.errors) == 1
+        assert results.directories_created == 1
+
+    def test_create_file_with_content(self, temp_dir: Path) -> None:
+        """Test that content replaces existing files and empty nodes keep them."""
+        tree = FileSystemTree("root")
+        tree.root.create_file("config.toml", content="[tool]\nname = 'ção'\n")
+        tree.root.create_file("empty.txt")
+
+        root_dir = temp_dir / "root"
+        root_dir.mkdir()
+        (root_dir / "config.toml").write_text("stale content that is longer")
+        (root_dir / "empty.txt").write_text("precious")
+
+        results = self.creator.create_structure(tree, temp_dir, create_files=True)
+
+        assert len(results.errors) == 0
+        config = root_dir / "config.toml"
+        assert config.read_text(encoding="utf-8") == "[tool]\nname = 'ção'\n"
+        assert (root_dir / "empty.txt").read_text() == "precious"
+
+    def test_multi_segment_names_from_syntax(self, temp_dir: Path) -> None:
+        """Test that file and directory names with separators are created."""
+        from treemancer.languages.structural import StructuralParser
+
+        tree = StructuralParser().parse("proj > src/utils > a.py | docs/api.md")
+
+        results = self.creator.create_structure(tree, temp_dir)
+
+        assert results.errors == []
+        assert results.directories_created == 2
+        assert results.files_created == 2
+        assert (temp_dir / "proj" / "src" / "utils" / "a.py").is_file()
+        assert (temp_dir / "proj" / "docs" / "api.md").is_file()
+
+    def test_create_structure_without_structure_collection(
+        self, sample_filesystem_tree: FileSystemTree, temp_dir: Path
+    ) -> None:
+        """Test skipping the created paths listing."""
+        results = self.creator.create_structure(
+            sample_filesystem_tree, temp_dir, dry_run=True, collect_structure=False
+        )
+
+        assert results.directories_created == 4
+        assert results.files_created == 8
+        assert results.structure == []
+
+    def test_create_structure_deep_tree(self, temp_dir: Path) -> None:
+        """Test that very deep trees do not hit the recursion limit."""
+        import sys
+
+        tree = FileSystemTree("root")
+        current = tree.root
+        for i in range(sys.getrecursionlimit() + 100):
+            current = current.create_directory(f"d{i}")
+        current.create_file("leaf.txt")
+
+        results = self.creator.create_structure(tree, temp_dir, dry_run=True)
+
+        assert results.directories_created == sys.getrecursionlimit() + 101
+        assert results.files_created == 1
+        assert results.structure[-1].endswith("leaf.txt")
+        assert len(results.errors) == 0
+
+    def test_create_structure_with_workers(self, temp_dir: Path) -> None:
+        """Test threaded creation of wide trees matches serial creation."""
+        tree = FileSystemTree("wide")
+        for i in range(6):
+            package = tree.root.create_directory(f"pkg{i}")
+            for j in range(5):
+                package.create_file(f"mod{j}.py", f"# {i}.{j}")
+
+        serial = self.creator.create_structure(tree, temp_dir / "serial")
+        threaded = TreeCreator(max_workers=4).create_structure(
+            tree, temp_dir / "threaded"
+        )
+
+        assert threaded.directories_created == serial.directories_created == 7
+        assert threaded.files_created == serial.files_created == 30
+        assert threaded.errors == []
+        assert [
+            os.path.relpath(path, temp_dir / "threaded") for path in threaded.structure
+        ] == [os.path.relpath(path, temp_dir / "serial") for path in serial.structure]
+        assert (temp_dir / "threaded" / "wide" / "pkg5" / "mod4.py").read_text() == (
+            "# 5.4"
+        )
+
+    def test_create_structure_async(
+        self, sample_filesystem_tree: FileSystemTree, temp_dir: Path
+    ) -> None:
+        """Test concurrent creation matches the synchronous results."""
+        import asyncio
+
+        results = asyncio.run(
+            self.creator.create_structure_async(sample_filesystem_tree, temp_dir)
+        )
+
+        assert results.directories_created == 4
+        assert results.files_created == 8
+        assert len(results.errors) == 0
+        assert (temp_dir / "project" / "src" / "package" / "__init__.py").is_file()
+        assert (temp_dir / "project" / "tests" / "conftest.py").is_file()
+
+    def test_create_structure_async_multi_segment_names(self, temp_dir: Path) -> None:
+        """Test that async creation handles names spanning several segments."""
+        import asyncio
+
+        from treemancer.languages.structural import StructuralParser
+
+        tree = StructuralParser().parse("proj > src/utils > a.py | docs/api.md")
+
+        results = asyncio.run(self.creator.create_structure_async(tree, temp_dir))
+
+        assert results.errors == []
+        assert results.directories_created == 2
+        assert results.files_created == 2
+        assert (temp_dir / "proj" / "src" / "utils" / "a.py").is_file()
+        assert (temp_dir / "proj" / "docs" / "api.md").is_file()
+
+    @pytest.mark.parametrize("use_async", [False, True], ids=["sync", "async"])
+    def test_failed_directory_skips_its_subtree(
+        self, temp_dir: Path, use_async: bool
+    ) -> None:
+        """Test that children of a directory that failed are not attempted."""
+        import asyncio
+
+        tree = FileSystemTree("root")
+        blocked = tree.root.create_directory("blocked")
+        blocked.create_directory("nested").create_file("deep.txt")
+        tree.root.create_file("ok.txt")
+
+        # A file where the directory should go makes its mkdir fail
+        (temp_dir / "root").mkdir()
+        (temp_dir / "root" / "blocked").write_text("not a directory")
+
+        if use_async:
+            results = asyncio.run(self.creator.create_structure_async(tree, temp_dir))
+        else:
+            results = self.creator.create_structure(tree, temp_dir)
+
+        assert len(results.errors) == 1
+        assert results.directories_created == 1
+        assert results.files_created == 1
+        assert results.structure == [
+            str(temp_dir / "root"),
+            str(temp_dir / "root" / "ok.txt"),
+        ]
+
+    def test_structure_in_depth_first_order(self, temp_dir: Path) -> None:
+        """Test that structure lists each directory followed by its children."""
+        import asyncio
+
+        tree = FileSystemTree("root")
+        tree.root.create_file("a.py")
+        sub = tree.root.create_directory("sub")
+        sub.create_file("b.py")
+        sub.create_directory("deep").create_file("c.py")
+        tree.root.create_file("d.txt")
+        tree.root.create_directory("last")
+
+        root = temp_dir / "root"
+        expected = [
+            str(root),
+            str(root / "a.py"),
+            str(root / "sub"),
+            str(root / "sub" / "b.py"),
+            str(root / "sub" / "deep"),
+            str(root / "sub" / "deep" / "c.py"),
+            str(root / "d.txt"),
+            str(root / "last"),
+        ]
+
+        preview = self.creator.create_structure(tree, temp_dir, dry_run=True)
+        assert preview.structure == expected
+        results = self.creator.create_structure(tree, temp_dir)
+        assert results.structure == expected
+        results = asyncio.run(self.creator.create_structure_async(tree, temp_dir))
+        assert results.structure == expected
+
+    def test_one_mkdir_per_directory(
+        self,
+        sample_filesystem_tree: FileSystemTree,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that each directory costs a single mkdir call."""
+        created: list[str] = []
+        real_mkdir = os.mkdir
+
+        def counting_mkdir(path: str, *args: int) -> None:
+            created.append(path)
+            real_mkdir(path, *args)
+
+        monkeypatch.setattr("treemancer.creator.os.mkdir", counting_mkdir)
+
+        results = self.creator.create_structure(
+            sample_filesystem_tree, temp_dir / "out"
+        )
+
+        assert results.directories_created == 4
+        # The base directory plus the four tree directories, none repeated
+        assert len(created) == len(set(created)) == 5
+
+    def test_quiet_creation_reports_errors_only_in_results(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that verbose=False keeps errors out of the console."""
+        tree = FileSystemTree("root")
+        tree.root.create_file("file\x00.txt")
+
+        results = self.creator.create_structure(tree, temp_dir, verbose=False)
+        assert len(results.errors) == 1
+        assert capsys.readouterr().out == ""
+
+        results = self.creator.create_structure(tree, temp_dir)
+        assert len(results.errors) == 1
+        assert "Error creating" in capsys.readouterr().out
+
+    def test_content_encoded_only_when_written(self, temp_dir: Path) -> None:
+        """Test that dry runs skip encoding and encoding errors are per file."""
+        tree = FileSystemTree("root")
+        tree.root.create_file("bad.txt", "\udc80")
+        tree.root.create_file("good.txt", "ok")
+
+        preview = self.creator.create_structure(tree, temp_dir, dry_run=True)
+        assert preview.errors == []
+        assert preview.files_created == 2
+
+        results = self.creator.create_structure(tree, temp_dir, verbose=False)
+        assert len(results.errors) == 1
+        assert results.files_created == 1
+        assert (temp_dir / "root" / "good.txt").read_text() == "ok"
+
+    def test_unexpected_errors_propagate(
+        self,
+        sample_filesystem_tree: FileSystemTree,
+        temp_dir: Path,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test that only filesystem errors are recorded, bugs still raise."""
+
+        def broken_mkdir(path: str) -> None:
+            raise RuntimeError("bug")
+
+        monkeypatch.setattr("treemancer.creator._make_dir", broken_mkdir)
+
+        with pytest.raises(RuntimeError, match="bug"):
+            self.creator.create_structure(sample_filesystem_tree, temp_dir)
+
+    def test_errors_print_bracketed_names_verbatim(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that error lines are not parsed as Rich markup."""
+        tree = FileSystemTree("root")
+        tree.root.create_file("[bold]bad\x00.txt")
+
+        self.creator.create_structure(tree, temp_dir)
+
+        assert "[bold]bad" in capsys.readouterr().out
+
+    def test_multiple_structures_failures_stay_per_tree(self, temp_dir: Path) -> None:
+        """Test that a tree whose directory fails does not affect the others."""
+        trees = [FileSystemTree("first"), FileSystemTree("second")]
+        for tree in trees:
+            tree.root.create_file("file.txt")
+        (temp_dir / "tree_02").write_text("not a directory")
+
+        first, second = self.creator.create_multiple_structures(
+            trees, temp_dir, verbose=False
+        )
+
+        assert first.errors == []
+        assert first.directories_created == 1
+        assert first.files_created == 1
+        assert first.structure == [
+            str(temp_dir / "tree_01" / "first"),
+            str(temp_dir / "tree_01" / "first" / "file.txt"),
+        ]
+        assert len(second.errors) == 1
+        assert "tree_02" in second.errors[0]
+        assert second.directories_created == second.files_created == 0
+        assert second.structure == []
+
+    def test_multiple_structures_dry_run(self, temp_dir: Path) -> None:
+        """Test that a multi-tree dry run counts every tree without creating."""
+        trees = [FileSystemTree("first"), FileSystemTree("second")]
+        trees[1].root.create_file("file.txt")
+
+        results = self.creator.create_multiple_structures(
+            trees, temp_dir / "out", dry_run=True, verbose=False
+        )
+
+        assert [r.directories_created for r in results] == [1, 1]
+        assert [r.files_created for r in results] == [0, 1]
+        assert not (temp_dir / "out").exists()
+
+    def test_multiple_structures_output_in_tree_order(
+        self, temp_dir: Path, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """Test that per-tree banners and errors are printed in tree order."""
+        broken = FileSystemTree("broken")
+        broken.root.create_file("file\x00.txt")
+        trees = [FileSystemTree("first"), broken, FileSystemTree("third")]
+
+        self.creator.create_multiple_structures(trees, temp_dir)
+
+        out = capsys.readouterr().out
+        assert out.index("Creating tree 1/3") < out.index("Creating tree 2/3")
+        assert out.index("Creating tree 2/3") < out.index("Error creating")
+        assert out.index("Error creating") < out.index("Creating tree 3/3")
+
+    def test_file_statistics_from_results(
+        self, sample_filesystem_tree: FileSystemTree, temp_dir: Path
+    ) -> None:
+        """Test that creation results carry the same file statistics as the tree."""
+        results = self.creator.create_structure(
+            sample_filesystem_tree, temp_dir, dry_run=True, collect_statistics=True
+        )
+
+        assert results.files_by_extension == (
+            self.creator.ui.collect_file_statistics(sample_filesystem_tree)
+        )
+        assert results.files_by_extension[".py"][:2] == ["main.py", "utils.py"]
+        assert self.creator.create_file_statistics_table(results).row_count == 3
+
+    def test_file_statistics_exclude_failed_files(self, temp_dir: Path) -> None:
+        """Test that file statistics only group the files that were created."""
+        tree = FileSystemTree("root")
+        tree.root.create_file("ok.py")
+        tree.root.create_file("bad\x00.py")
+        tree.root.create_file("README")
+
+        results = self.creator.create_structure(
+            tree, temp_dir, verbose=False, collect_statistics=True
+        )
+
+        assert results.files_by_extension == {
+            ".py": ["ok.py"],
+            "no extension": ["README"],
+        }
+        assert self.creator.create_structure(tree, temp_dir).files_by_extension == {}
+
+    def test_names_normalized_like_pathlib(self, temp_dir: Path) -> None:
+        """Test that separators in names do not leak into created paths."""
+        from treemancer.languages.structural import StructuralParser
+
+        tree = StructuralParser().parse("proj > src/ > a.py")
+
+        results = self.creator.create_structure(tree, temp_dir)
+
+        assert results.errors == []
+        assert results.structure == [
+            str(temp_dir / "proj"),
+            str(temp_dir / "proj" / "src"),
+            str(temp_dir / "proj" / "src" / "a.py"),
+        ]
@@ -279,6 +279,24 @@ class TestFileSystemTree:
         not_removed = parent.remove_child("nonexistent")
         assert not_removed is None
 
+    def test_children_partitioned_by_type(self) -> None:
+        """Test files and subdirs stay in sync with children."""
+        parent = DirectoryNode("parent")
+        file1 = parent.create_file("a.txt")
+        subdir = parent.create_directory("sub")
+        file2 = parent.create_file("b.txt")
+
+        assert parent.files == [file1, file2]
+        assert parent.subdirs == [subdir]
+        assert subdir.is_directory
+        assert not file1.is_directory
+
+        parent.remove_child("a.txt")
+        parent.remove_child("sub")
+
+        assert parent.files == [file2]
+        assert parent.subdirs == []
+
     def test_get_child(self) -> None:
         """Test getting child by name."""
         parent = DirectoryNode("parent")
@@ -372,6 +390,21 @@ class TestFileSystemTree:
         assert "main.py" in file_names
         assert "helper.py" in file_names
 
+    def test_get_all_files_deep_tree(self) -> None:
+        """Test that deep trees are walked in order without recursion limits."""
+        root = DirectoryNode("root")
+        current = root
+        for depth in range(2000):
+            current.create_file(f"file_{depth}.txt")
+            current = current.create_directory(f"level_{depth}")
+        root.create_file("last.txt")
+
+        file_names = [f.name for f in root.get_all_files()]
+
+        assert len(file_names) == 2001
+        assert file_names[:2] == ["file_0.txt", "file_1.txt"]
+        assert file_names[-1] == "last.txt"
+
     def test_repr_methods(self) -> None:
         """Test string representations."""
         # Test FileNode repr
@@ -12,11 +12,16 @@ import os
 from pathlib import Path
 import re
 import shutil
-import subprocess
 import tempfile
 from typing import List
 
 import pytest
+from typer.testing import CliRunner
+
+from treemancer.cli import app
+
+
+_RUNNER = CliRunner()
 
 
 class CommandType(Enum):
@@ -247,21 +252,17 @@ class TestCliDocumentation:
     def test_cli_help_accessibility(self):
         """Test that CLI help commands work."""
         help_commands = [
-            ["python", "-m", "treemancer", "--help"],
-            ["python", "-m", "treemancer", "create", "--help"],
-            ["python", "-m", "treemancer", "preview", "--help"],
+            ["--help"],
+            ["create", "--help"],
+            ["preview", "--help"],
         ]
 
         for cmd in help_commands:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _RUNNER.invoke(app, cmd)
 
-            assert result.returncode == 0, (
-                f"Help command failed: {' '.join(cmd)}\nSTDERR: {result.stderr}"
+            assert result.exit_code == 0, (
+                f"Help command failed: treemancer {' '.join(cmd)}\n"
+                f"OUTPUT: {result.output}"
             )
 
             # Should contain TreeMancer branding
@@ -297,27 +298,16 @@ class TestCliDocumentation:
 
     def _test_single_command(self, command: CommandExample) -> bool:
         """Test a single CLI command and return success status."""
-        try:
-            # Build command arguments
-            cmd_args = ["python", "-m", "treemancer", command.type.value]
-            cmd_args.append(command.content)
+        # Build command arguments
+        cmd_args = [command.type.value, command.content]
 
-            # Always use dry-run for create commands in tests
-            if command.type == CommandType.CREATE:
-                cmd_args.append("--dry-run")
+        # Always use dry-run for create commands in tests
+        if command.type == CommandType.CREATE:
+            cmd_args.append("--dry-run")
 
-            # Execute command
-            result = subprocess.run(
-                cmd_args,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
-
-            return result.returncode == 0
-
-        except (subprocess.TimeoutExpired, Exception):
-            return False
+        # Execute command
+        result = _RUNNER.invoke(app, cmd_args)
+        return result.exit_code == 0
 
     def test_specific_cli_examples(self, temp_environment: str):
         """Test specific examples that should always work."""
@@ -331,20 +321,14 @@ class TestCliDocumentation:
         ]
 
         for cmd_type, content in critical_examples:
-            cmd_args = ["python", "-m", "treemancer", cmd_type, content]
+            cmd_args = [cmd_type, content]
 
             if cmd_type == "create":
                 cmd_args.append("--dry-run")
 
-            result = subprocess.run(
-                cmd_args,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _RUNNER.invoke(app, cmd_args)
 
-            assert result.returncode == 0, (
+            assert result.exit_code == 0, (
                 f"Critical CLI example failed: treemancer {cmd_type} {content}\n"
-                f"STDERR: {result.stderr}\n"
-                f"STDOUT: {result.stdout}"
+                f"OUTPUT: {result.output}"
             )
@@ -10,11 +10,16 @@ import os
 from pathlib import Path
 import re
 import shutil
-import subprocess
 import tempfile
 from typing import List
 
 import pytest
+from typer.testing import CliRunner
+
+from treemancer.cli import app
+
+
+_RUNNER = CliRunner()
 
 
 class CommandType(Enum):
@@ -159,23 +164,17 @@ class TestReadmeDocumentation:
     def test_critical_commands_work(self):
         """Test specific critical commands that must always work."""
         critical_commands = [
-            ["python", "-m", "treemancer", "preview", "test > main.py"],
-            ["python", "-m", "treemancer", "create", "test > main.py", "--dry-run"],
-            ["python", "-m", "treemancer", "--help"],
+            ["preview", "test > main.py"],
+            ["create", "test > main.py", "--dry-run"],
+            ["--help"],
         ]
 
         for cmd in critical_commands:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            result = _RUNNER.invoke(app, cmd)
 
-            assert result.returncode == 0, (
-                f"Critical command failed: {' '.join(cmd)}\n"
-                f"STDERR: {result.stderr}\n"
-                f"STDOUT: {result.stdout}"
+            assert result.exit_code == 0, (
+                f"Critical command failed: treemancer {' '.join(cmd)}\n"
+                f"OUTPUT: {result.output}"
             )
 
     def test_readme_commands_sample(self, temp_environment: str):
@@ -251,27 +250,16 @@ class TestReadmeDocumentation:
 
     def _test_single_command(self, command: TreeMancerCommand) -> bool:
         """Test a single command and return success status."""
-        try:
-            # Build command arguments
-            cmd_args = ["python", "-m", "treemancer", command.type.value]
-            cmd_args.append(command.content)
-
-            # Always use dry-run for create commands in tests
-            if command.type == CommandType.CREATE:
-                cmd_args.append("--dry-run")
-
-            # Execute command
-            result = subprocess.run(
-                cmd_args,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+        # Build command arguments
+        cmd_args = [command.type.value, command.content]
 
-            return result.returncode == 0
+        # Always use dry-run for create commands in tests
+        if command.type == CommandType.CREATE:
+            cmd_args.append("--dry-run")
 
-        except (subprocess.TimeoutExpired, Exception):
-            return False
+        # Execute command
+        result = _RUNNER.invoke(app, cmd_args)
+        return result.exit_code == 0
 
     def test_documentation_coverage(self):
         """Ensure README has good coverage of TreeMancer features."""
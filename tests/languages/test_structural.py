@@ -262,6 +262,13 @@ class TestStructuralIntegration:
         ):
             self.parser.parse(invalid_syntax)
 
+    def test_consecutive_separators_error(self):
+        """Test that a separator with no node before the next one fails."""
+        with pytest.raises(
+            StructuralParseError, match="Expected name or type hint, got separator"
+        ):
+            self.parser.parse("invalid > > missing_name")
+
     def test_multiple_cascade_resets(self):
         """Test multiple valid cascade resets."""
         # project > src > file1.py | file2.py | tests > test1.py
@@ -0,0 +1 @@
+"""UI tests package."""
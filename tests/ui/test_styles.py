@@ -0,0 +1,68 @@
+"""Tests for FileStyler module."""
+
+from pathlib import Path
+
+import pytest
+
+from treemancer.ui.styles import FileStyler
+from treemancer.ui.styles import get_extension
+
+
+@pytest.mark.parametrize(
+    "filename",
+    ["main.py", "README.MD", "archive.tar.gz", ".gitignore", "Makefile", "a.", "."],
+)
+def test_get_extension_matches_pathlib(filename: str) -> None:
+    """Test extension extraction agrees with pathlib suffixes."""
+    assert get_extension(filename) == Path(filename).suffix.lower()
+
+
+class TestFileStyler:
+    """Test cases for FileStyler."""
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("main.py", ("🐍", "bright_yellow")),
+            ("App.TSX", ("⚛️", "cyan")),
+            ("archive.tar.gz", ("📦", "yellow")),
+            (".env", ("🔑", "dim white")),
+            ("notes", ("📄", "white")),
+            ("trailing.", ("📄", "white")),
+            ("", ("📄", "white")),
+        ],
+    )
+    def test_file_style_by_extension(
+        self, filename: str, expected: tuple[str, str]
+    ) -> None:
+        """Test styles resolved from the file extension."""
+        assert FileStyler.get_file_style(filename) == expected
+
+    @pytest.mark.parametrize(
+        ("filename", "expected"),
+        [
+            ("Dockerfile", ("🐳", "blue")),
+            ("LICENSE", ("📄", "dim white")),
+            ("package.json", ("📦", "green")),
+            ("CMakeLists.txt", ("🔧", "blue")),
+        ],
+    )
+    def test_special_filename_takes_precedence(
+        self, filename: str, expected: tuple[str, str]
+    ) -> None:
+        """Test special filenames win over their extension style."""
+        assert FileStyler.get_file_style(filename) == expected
+
+    @pytest.mark.parametrize(
+        ("dirname", "expected"),
+        [
+            ("src", ("📂", "bright_blue")),
+            (".cache", ("👁️", "dim white")),
+            ("unit_tests", ("🧪", "green")),
+            ("user_guide", ("📚", "bright_cyan")),
+            ("whatever", ("📁", "bold blue")),
+        ],
+    )
+    def test_directory_style(self, dirname: str, expected: tuple[str, str]) -> None:
+        """Test directory styles from exact names and name patterns."""
+        assert FileStyler.get_directory_style(dirname) == expected